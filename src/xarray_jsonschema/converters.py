@@ -19,3 +19,15 @@ def optional_type(
         return converter(obj)  # type: ignore [reportCallIssue]
 
     return optional_converter
+
+
+def optional_tuple(obj: object) -> tuple | None:
+    """Optionally convert an iterable to a tuple.
+
+    A bare string is wrapped as a 1-tuple rather than split into characters, as in ``xarray`` where ``dims='x'`` is equivalent to ``dims=('x',)``.
+    """
+    if obj is None:
+        return None
+    if isinstance(obj, str):
+        return (obj,)
+    return tuple(obj)  # type: ignore [reportArgumentType]
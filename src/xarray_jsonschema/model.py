@@ -9,6 +9,7 @@ import json
 import re
 from abc import ABC, abstractmethod
 from collections.abc import Mapping, Sequence
+from functools import cache, cached_property
 from typing import Any, ClassVar, Generic, Self, TypeAlias, TypeVar
 
 import attrs as at
@@ -22,7 +23,7 @@ from xarray_jsonschema import converters
 from xarray_jsonschema.schema import (
     SchemaBuilder,
 )
-from xarray_jsonschema.validator import XarrayValidator
+from xarray_jsonschema.validator import ValidationError, XarrayValidator
 
 __all__ = [
     'AttrsModel',
@@ -60,6 +61,14 @@ def value_serializer(
     return value
 
 
+@cache
+def _init_fields(cls: type) -> frozenset[str]:
+    """Return the names of the attributes accepted by a model's ``__init__``."""
+    return frozenset(
+        attribute.name for attribute in at.fields(cls) if attribute.init
+    )
+
+
 def filter(attr: at.Attribute, value: object) -> bool:
     """Return `False` if the attribute is private or optional.
 
@@ -79,17 +88,19 @@ class Model(ABC, Generic[TObj]):
 
     _validator: ClassVar = XarrayValidator
     """The JSON Schema validator class used for validation."""
-    _builder: gs.SchemaBuilder = at.field(init=False, factory=SchemaBuilder)
+    _builder: gs.SchemaBuilder = at.field(
+        init=False, factory=SchemaBuilder, eq=False, repr=False
+    )
     """The JSON Schema builder instance used for schema generation."""
 
     def __attrs_post_init__(self) -> None:
         # Models are immutable so we build once only.
         self.build()
 
-    @property
+    @cached_property
     def validator(self) -> jsp.Validator:
         """The validator instance for this model"""
-        return self._validator(schema=self.to_schema())  # type: ignore
+        return self._validator(schema=self._schema)  # type: ignore
 
     @abstractmethod
     def build(self) -> None:
@@ -112,9 +123,33 @@ class Model(ABC, Generic[TObj]):
         """
         return self._validate(obj)
 
+    def is_valid(self, obj: TObj) -> bool:
+        """Return whether an object is valid against this model's schema.
+
+        Parameters
+        ----------
+        obj : TObj
+           The object to validate.
+
+        Returns
+        -------
+        bool
+           ``True`` if the object matches the schema, otherwise ``False``.
+        """
+        try:
+            self.validate(obj)
+        except ValidationError:
+            return False
+        return True
+
     def _validate(self, instance: Any) -> None:
         return self.validator.validate(instance=instance)
 
+    @cached_property
+    def _schema(self) -> Mapping[str, object]:
+        # Models are immutable so the schema is generated once only.
+        return self._builder.to_schema()
+
     def to_schema(self) -> Mapping[str, object]:
         """Return the JSON schema for this model.
 
@@ -125,6 +160,10 @@ class Model(ABC, Generic[TObj]):
         """
         return self._builder.to_schema()
 
+    @cached_property
+    def _json(self) -> str:
+        return json.dumps(self._schema)
+
     def to_dict(self) -> dict[str, object]:
         """Return this model as a dictionary.
 
@@ -152,7 +191,9 @@ class Model(ABC, Generic[TObj]):
         str
             The JSON schema representation of this model as a
         """
-        return json.dumps(self.to_schema(), *args, **kwargs)
+        if not (args or kwargs):
+            return self._json
+        return json.dumps(self._schema, *args, **kwargs)
 
     def __call__(self, obj: TObj) -> None:
         """Validate an object against this model's schema.
@@ -183,7 +224,7 @@ class Model(ABC, Generic[TObj]):
         Self
           A new instance of this class.
         """
-        keys = [attribute.name for attribute in at.fields(cls)]
+        keys = _init_fields(cls)
         return cls(
             **{key: value for key, value in data.items() if key in keys}
         )
@@ -278,14 +319,19 @@ class DimsModel(Model[Sequence]):
     Parameters
     ----------
     dims : DimsLike | None
-        The expected sequence of dimension names. Order matters.
+        The expected sequence of dimension names. Order matters. A bare
+        string is a single dimension name, as in ``xarray``.
 
     Attributes
     ----------
     dims
     """
 
-    dims: DimsLike | None = at.field(factory=tuple, kw_only=False)
+    dims: DimsLike | None = at.field(
+        factory=tuple,
+        converter=converters.optional_tuple,
+        kw_only=False,
+    )
 
     def build(self) -> None:
         return self._builder.add_object(self.dims)
@@ -308,7 +354,11 @@ class ShapeModel(Model[Sequence]):
     shape
     """
 
-    shape: ShapeLike | None = at.field(factory=tuple, kw_only=False)
+    shape: ShapeLike | None = at.field(
+        factory=tuple,
+        converter=converters.optional_type(tuple),
+        kw_only=False,
+    )
 
     def build(self) -> None:
         return self._builder.add_object(self.shape)
@@ -453,7 +503,16 @@ class DataArrayModel(Model[xr.DataArray]):
         return super().build()
 
     def validate(self, obj: xr.DataArray) -> None:
-        return self._validate(obj.to_dict(data=False))
+        # Equivalent to ``obj.to_dict(data=False)``, but coordinates are only
+        # serialized when the model constrains them.
+        instance = obj.variable.to_dict(data=False)
+        instance['name'] = obj.name
+        if self.coords is not None:
+            instance['coords'] = {
+                key: coord.variable.to_dict(data=False)
+                for key, coord in obj.coords.items()
+            }
+        return self._validate(instance)
 
 
 @at.define(kw_only=True, frozen=True)
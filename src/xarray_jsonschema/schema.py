@@ -77,8 +77,9 @@ class Tuple(st.SchemaStrategy):
         self._add(obj, 'add_object')
 
     def _add(self, items: list | tuple | set, func: str) -> None:
-        while len(self.prefix_items) < len(items):
-            self.prefix_items.append(self.node_class())
+        missing = len(items) - len(self.prefix_items)
+        if missing > 0:
+            self.prefix_items.extend(self.node_class() for _ in range(missing))
 
         for subschema, item in zip(self.prefix_items, items):
             getattr(subschema, func)(item)
@@ -106,7 +107,7 @@ class Pattern(st.String):
 
     @classmethod
     def match_schema(cls, schema: Mapping) -> bool:
-        return 'string' in schema and 'pattern' in schema
+        return schema.get('type') == 'string' and 'pattern' in schema
 
     @classmethod
     def match_object(cls, obj: object) -> bool:
@@ -114,11 +115,12 @@ class Pattern(st.String):
 
     def __init__(self, node_class: type[gs.SchemaNode]) -> None:
         super().__init__(node_class)
-        self.pattern = None
+        self.pattern: re.Pattern | None = None
 
     def add_schema(self, schema: Mapping) -> None:
         super().add_schema(schema)
-        self.pattern = re.compile(schema.get('pattern', self.pattern))
+        if 'pattern' in schema:
+            self.pattern = re.compile(schema['pattern'])
 
     def add_object(self, obj: re.Pattern) -> None:
         super().add_object(obj)
@@ -126,7 +128,8 @@ class Pattern(st.String):
 
     def to_schema(self) -> dict:
         schema = super().to_schema()
-        schema['pattern'] = getattr(self.pattern, 'pattern', self.pattern)
+        if self.pattern is not None:
+            schema['pattern'] = self.pattern.pattern
         return schema
 
 
@@ -11,11 +11,12 @@ from jsonschema.protocols import Validator
 __all__ = ['XarrayValidator', 'SchemaError', 'ValidationError']
 
 
+_is_type = Draft202012Validator.TYPE_CHECKER.is_type
+
+
 def is_array_like(checker: TypeChecker, instance: object):
     """Check if an instance is an array-like object."""
-    return Draft202012Validator.TYPE_CHECKER.is_type(
-        instance, 'array'
-    ) or isinstance(instance, tuple)
+    return isinstance(instance, tuple) or _is_type(instance, 'array')
 
 
 XarrayValidator: type[Validator] = validators.extend(
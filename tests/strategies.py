@@ -19,38 +19,37 @@ REGEX_PATTERNS = [
     r'^v\d+\.\d+$',  # Version number format
 ]
 
+_compiled_patterns = tuple(re.compile(pattern) for pattern in REGEX_PATTERNS)
 
-@st.composite
-def patterns(draw: st.DrawFn) -> re.Pattern:
-    """Generate regular expression patterns."""
-    return re.compile(draw(st.sampled_from(REGEX_PATTERNS)))
+
+patterns: st.SearchStrategy[re.Pattern] = st.sampled_from(_compiled_patterns)
+"""Generate regular expression patterns."""
 
 
 _readable_characters = st.characters(
     categories=['L', 'N'], max_codepoint=0x017F
 )
+readable_text: st.SearchStrategy[str] = st.text(
+    _readable_characters, min_size=1, max_size=5
+)
+"""Generate short strings of letters and numbers."""
 
 
-def readable_text(min_length=0, max_length=5):
-    return st.text(_readable_characters, min_size=1, max_size=5)
+_supported_dtypes = st.one_of(
+    st.none(),
+    xrst.supported_dtypes(),
+    st.sampled_from([int, float, bool, str, complex]),
+).map(np.dtype)
 
 
-@st.composite
 def supported_dtype_likes(
-    draw: st.DrawFn,
     dtype: np.dtype | None = None,
-) -> np.dtype | str | type | None:
+) -> st.SearchStrategy[np.dtype | str | type | None]:
     """Generate supported dtype-like objects."""
-    if dtype is None:
-        _dtype_strategy = st.one_of(
-            st.none(),
-            xrst.supported_dtypes(),
-            st.sampled_from([int, float, bool, str, complex]),
-        )
-        dtype = np.dtype(draw(_dtype_strategy))
+    dtypes = _supported_dtypes if dtype is None else st.just(dtype)
 
-    return draw(
-        st.sampled_from(
+    return dtypes.flatmap(
+        lambda dtype: st.sampled_from(
             [
                 # dtype
                 dtype,
@@ -70,7 +69,7 @@ _attr_values = st.one_of(
     st.booleans(),
     st.floats(),
     st.integers(),
-    readable_text(),
+    readable_text,
 )
 
 
@@ -80,10 +79,10 @@ def attrs(
     """Generate nested attribute mappings"""
     return st.recursive(
         base=st.dictionaries(
-            keys=readable_text(), values=_attr_values, min_size=min_items
+            keys=readable_text, values=_attr_values, min_size=min_items
         ),
         extend=lambda children: st.dictionaries(
-            keys=readable_text(), values=children, min_size=min_items
+            keys=readable_text, values=children, min_size=min_items
         ),
         max_leaves=max_leaves,
     )
@@ -80,3 +80,9 @@ class TestAttrs:
 
         with pt.raises(ValidationError):
             AttrsModel(expected).validate(actual)
+
+    def test_invalidation_non_string_keys(self) -> None:
+        """Should fail if a value under a non-string key does not match."""
+        AttrsModel({1: 'a'}).validate({1: 'a'})
+        with pt.raises(ValidationError):
+            AttrsModel({1: 'a'}).validate({1: 'b'})
@@ -1,10 +1,12 @@
 import hypothesis as hp
 import hypothesis.extra.numpy as npst
 import hypothesis.strategies as st
+import numpy as np
+import pytest as pt
 import xarray as xr
 import xarray.testing.strategies as xrst
 
-from xarray_jsonschema import DataArrayModel
+from xarray_jsonschema import DataArrayModel, ValidationError
 
 from .strategies import attrs, readable_text, supported_dtype_likes
 
@@ -14,7 +16,7 @@ class TestDataArrayModel:
         attrs=st.one_of(attrs(), st.none()),
         dims=st.one_of(xrst.dimension_names(), st.none()),
         shape=st.one_of(npst.array_shapes(), st.none()),
-        name=st.one_of(readable_text(), st.none()),
+        name=st.one_of(readable_text, st.none()),
         dtype=st.one_of(supported_dtype_likes(), st.none()),
     )
     def test_generates_valid_schema(
@@ -30,3 +32,30 @@ class TestDataArrayModel:
         """Should validate any data array when instantiated with default values."""
         da = xr.tutorial.open_dataset('air_temperature').air
         DataArrayModel().validate(da)
+
+    def test_validation(self):
+        """Should pass if the data array matches the expected features."""
+        da = xr.DataArray(
+            np.zeros((2, 3)),
+            coords={'x': [1, 2]},
+            dims=('x', 'y'),
+            name='a',
+            attrs={'units': 'm'},
+        )
+        DataArrayModel(
+            dtype='float64',
+            dims=('x', 'y'),
+            name='a',
+            shape=(2, 3),
+            attrs={'units': str},
+        ).validate(da)
+
+    def test_coords_validation(self):
+        """Should validate coordinates only when the model includes them."""
+        da = xr.DataArray(np.zeros(2), coords={'x': [1, 2]}, dims='x')
+        DataArrayModel().validate(da)
+        DataArrayModel(coords={'x': DataArrayModel(dims=('x',))}).validate(da)
+
+        model = DataArrayModel(coords={'x': DataArrayModel(dims=('y',))})
+        with pt.raises(ValidationError):
+            model.validate(da)
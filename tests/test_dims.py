@@ -26,6 +26,18 @@ class TestDims:
     def test_argument_is_not_kw_only(self, expected: Sequence) -> None:
         assert DimsModel(expected) == DimsModel(dims=expected)
 
+    @hp.given(expected=xt.dimension_names(min_dims=1))
+    def test_sequence_is_converted_to_tuple(self, expected: Sequence) -> None:
+        assert DimsModel(list(expected)).dims == tuple(expected)
+
+    def test_string_is_a_single_dimension(self) -> None:
+        """Should treat a bare string as one dimension name, as xarray does."""
+        model = DimsModel('time')
+        assert model.dims == ('time',)
+        model.validate(('time',))
+        with pt.raises(ValidationError):
+            model.validate(('t', 'i', 'm', 'e'))
+
     @hp.given(expected=xt.dimension_names(min_dims=1))
     def test_validation(self, expected: Sequence) -> None:
         """Should pass if the instance dims matches the expected sequence."""
@@ -80,6 +80,25 @@ class TestModelClass:
         model = SimpleModel.from_dict(data)
         assert model.to_dict() == data
 
+    def test_is_valid(self) -> None:
+        """Should report whether an object matches the model's schema."""
+        model = SimpleModel(uid=str, count=int)
+        assert model.is_valid({'uid': 'abc', 'count': 42})
+        assert not model.is_valid({'uid': 42, 'count': 'abc'})
+
+    def test_equality_ignores_builder(self) -> None:
+        """Should compare and hash models by their fields only."""
+        model = SimpleModel(uid=str, count=42)
+        other = SimpleModel(uid=str, count=42)
+        assert model == other
+        assert hash(model) == hash(other)
+        assert model != SimpleModel(uid=str, count=43)
+
+    def test_validator_is_cached(self) -> None:
+        """Should build the validator once per model."""
+        model = SimpleModel(uid=str, count=42)
+        assert model.validator is model.validator
+
     def test_to_schema(self) -> None:
         """Should generate a schema from the model."""
         model = SimpleModel(uid=str, count=42)
@@ -94,6 +113,16 @@ class TestModelClass:
             'required': ['count', 'uid'],
         }
 
+    def test_to_schema_returns_a_copy(self) -> None:
+        """Should not let changes to a returned schema reach the model."""
+        model = SimpleModel(uid=str, count=42)
+        expected = model.to_json()
+        schema = model.to_schema()
+        schema['properties']['count']['const'] = 43
+        assert model.to_json() == expected
+        assert model.to_schema()['properties']['count'] == {'const': 42}
+        model.validate({'uid': 'abc', 'count': 42})
+
     def test_to_json(self) -> None:
         """Should generate a JSON string from the model."""
         model = SimpleModel(uid=str, count=42)
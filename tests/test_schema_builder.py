@@ -11,7 +11,7 @@ from xarray_jsonschema.schema import (
 )
 
 scalars = st.one_of(
-    st.integers(), st.floats(allow_nan=False), readable_text(), st.booleans()
+    st.integers(), st.floats(allow_nan=False), readable_text, st.booleans()
 )
 
 
@@ -56,7 +56,7 @@ class TestPattern:
     @hp.given(data=st.data())
     def test_add_object(self, data: st.DataObject) -> None:
         builder = SchemaBuilder(None)  # type: ignore[reportArgumentType]
-        obj = data.draw(patterns())
+        obj = data.draw(patterns)
 
         builder.add_object(obj)
         schema = builder.to_schema()
@@ -73,6 +73,19 @@ class TestPattern:
 
         assert builder.to_schema() == schema
 
+    @hp.given(data=st.data())
+    def test_roundtrip(self, data: st.DataObject) -> None:
+        obj = data.draw(patterns)
+        builder = SchemaBuilder(None)  # type: ignore[reportArgumentType]
+        builder.add_object(obj)
+        schema = builder.to_schema()
+
+        builder = SchemaBuilder(None)  # type: ignore[reportArgumentType]
+        builder.add_schema(schema)
+        builder.add_object(obj)
+
+        assert builder.to_schema() == schema
+
 
 class TestConst:
     @hp.given(data=st.data())
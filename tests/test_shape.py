@@ -26,6 +26,10 @@ class TestShape:
     def test_argument_is_not_kw_only(self, expected: Sequence) -> None:
         assert ShapeModel(expected) == ShapeModel(shape=expected)
 
+    @hp.given(expected=hn.array_shapes(max_side=5))
+    def test_sequence_is_converted_to_tuple(self, expected: Sequence) -> None:
+        assert ShapeModel(list(expected)).shape == tuple(expected)
+
     @hp.given(expected=hn.array_shapes(max_side=5))
     def test_validation(self, expected: Sequence) -> None:
         """Should pass if the instance shape matches the expected sequence."""